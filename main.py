@@ -1,11 +1,16 @@
-import csv
+import functools
+import gc
+import math
 import random
 import time
 import numpy as np
 from typing import List, Tuple, Optional, Any
-import statistics
 from transformations import process_array
 
+# Общий генератор PCG64 для всех методов (быстрее устаревшего np.random.*)
+_rng = np.random.default_rng()
+_INT64 = np.iinfo(np.int64)
+
 def write_list_to_csv(data: List[int], filename: str) -> None:
     """
     Записывает список чисел в CSV файл.
@@ -14,76 +19,171 @@ def write_list_to_csv(data: List[int], filename: str) -> None:
         data: Список чисел для записи
         filename: Имя файла для записи
     """
-    with open(filename, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(['number'])
-        for item in data:
-            writer.writerow([item])
+    # Целые числа не требуют экранирования, поэтому собираем файл целиком и пишем одним вызовом
+    payload = "number\n" + "".join(f"{item}\n" for item in data)
+    with open(filename, 'w', buffering=1 << 20, newline='', encoding='utf-8') as file:
+        file.write(payload)
+
+def _parity_range(a: int, b: int, even_only: bool) -> Tuple[int, int]:
+    """
+    Находит первое число нужной четности в [a, b] и количество таких чисел.
+
+    Returns:
+        Кортеж (первое подходящее число, количество подходящих чисел)
+    """
+    parity = 0 if even_only else 1
+    start = a + ((a & 1) ^ parity)
+    count = (b - start) // 2 + 1 if start <= b else 0
+    return start, count
+
+def _draw_batch_size(n: int, found: int, a: int, b: int, count: int) -> int:
+    """
+    Оценивает размер блока случайных чисел, достаточный для отбора недостающих.
+
+    Args:
+        n: Сколько чисел требуется всего
+        found: Сколько уникальных чисел уже отобрано
+        a: Нижняя граница интервала
+        b: Верхняя граница интервала
+        count: Количество чисел нужной четности в [a, b]
+
+    Returns:
+        Размер блока с запасом 20% относительно ожидаемого числа попыток,
+        но не меньше 256
+    """
+    # Кандидат принимается, если у него нужная четность и он еще не встречался
+    parity_rate = count / (b - a + 1)
+    unique_rate = (count - found) / count
+    batch = math.ceil((n - found) / (parity_rate * unique_rate) * 1.2)
+    # Нижняя граница не дает блокам измельчаться при заполнении результата
+    return max(batch, 256)
+
+def _draw_block(a: int, b: int, size: int) -> np.ndarray:
+    """
+    Генерирует блок случайных чисел из [a, b].
+
+    Если границы не помещаются в int64, numpy не может сгенерировать такие
+    числа, поэтому блок заполняется через random.randint (массив object).
+
+    Args:
+        a: Нижняя граница интервала
+        b: Верхняя граница интервала
+        size: Размер блока
+
+    Returns:
+        Массив случайных чисел
+    """
+    if _INT64.min <= a and b <= _INT64.max:
+        return _rng.integers(a, b, size=size, endpoint=True)
+    return np.array([random.randint(a, b) for _ in range(size)], dtype=object)
+
+def _select_parity(draws: np.ndarray, even_only: bool) -> np.ndarray:
+    """
+    Оставляет в массиве только числа нужной четности.
+
+    Четность определяется младшим битом (draws & 1), что numpy выполняет
+    векторно; для отрицательных чисел результат тот же, что и у % 2.
+    """
+    odd_mask = (draws & 1).astype(bool)
+    return draws[~odd_mask] if even_only else draws[odd_mask]
+
+def write_array_to_csv(data: np.ndarray, filename: str) -> None:
+    """
+    Записывает массив целых чисел в CSV файл средствами numpy.
+
+    Args:
+        data: Массив чисел для записи
+        filename: Имя файла для записи
+    """
+    with open(filename, 'w', buffering=1 << 20, newline='', encoding='utf-8') as file:
+        np.savetxt(file, data, fmt='%d', header='number', comments='')
 
 def generate_random_numbers_list(n: int, a: int, b: int, even_only: bool = True) -> List[int]:
     """
-    Генерирует список случайных чисел без повторов используя list и random.randint.
-    
+    Генерирует список случайных чисел без повторов используя list.
+
+    Кандидаты генерируются блоками через numpy, отбор по четности и
+    проверка повторов выполняются поэлементно.
+
     Args:
         n: Количество чисел для генерации
         a: Нижняя граница интервала
         b: Верхняя граница интервала
         even_only: True для четных чисел, False для нечетных
-    
+
     Returns:
         Список уникальных случайных чисел
     """
     numbers = []
-    attempts = 0
-    max_attempts = n * 100  # Защита от бесконечного цикла
-    
-    while len(numbers) < n and attempts < max_attempts:
-        num = random.randint(a, b)
-        attempts += 1
-        if even_only and num % 2 == 0 and num not in numbers:
-            numbers.append(num)
-        elif not even_only and num % 2 != 0 and num not in numbers:
-            numbers.append(num)
-    
+    seen = set()  # O(1) проверка повторов вместо поиска по списку
+    _, count = _parity_range(a, b, even_only)
+    if count < n:
+        raise RuntimeError(f"Недостаточно {'четных' if even_only else 'нечетных'} чисел в диапазоне")
+    draws_left = n * 100  # Защита от бесконечного цикла
+
+    while len(numbers) < n and draws_left > 0:
+        batch = min(_draw_batch_size(n, len(numbers), a, b, count), draws_left)
+        draws_left -= batch
+        draws = _draw_block(a, b, batch)
+        for num in _select_parity(draws, even_only).tolist():
+            if num not in seen:
+                seen.add(num)
+                numbers.append(num)
+                if len(numbers) == n:
+                    break
+
     if len(numbers) < n:
-        raise RuntimeError(f"Не удалось сгенерировать {n} чисел за {max_attempts} попыток")
-    
+        raise RuntimeError(f"Не удалось сгенерировать {n} чисел за {n * 100} попыток")
+
     return numbers
 
 def generate_random_numbers_set(n: int, a: int, b: int, even_only: bool = True) -> List[int]:
     """
     Генерирует список случайных чисел без повторов используя set.
-    
+
+    Кандидаты генерируются блоками через numpy, повторы отбрасывает set.
+
     Args:
         n: Количество чисел для генерации
         a: Нижняя граница интервала
         b: Верхняя граница интервала
         even_only: True для четных чисел, False для нечетных
-    
+
     Returns:
         Список уникальных случайных чисел
     """
     numbers = set()
-    attempts = 0
-    max_attempts = n * 100  
-    
-    while len(numbers) < n and attempts < max_attempts:
-        num = random.randint(a, b)
-        attempts += 1
-        if even_only and num % 2 == 0:
-            numbers.add(num)
-        elif not even_only and num % 2 != 0:
-            numbers.add(num)
-    
+    _, count = _parity_range(a, b, even_only)
+    if count < n:
+        raise RuntimeError(f"Недостаточно {'четных' if even_only else 'нечетных'} чисел в диапазоне")
+    draws_left = n * 100  # Защита от бесконечного цикла
+
+    while len(numbers) < n and draws_left > 0:
+        batch = min(_draw_batch_size(n, len(numbers), a, b, count), draws_left)
+        draws_left -= batch
+        draws = _draw_block(a, b, batch)
+        candidates = _select_parity(draws, even_only).tolist()
+        if len(numbers) + len(candidates) <= n:
+            numbers.update(candidates)
+        else:
+            # Добавляем по одному, чтобы не превысить n
+            for num in candidates:
+                numbers.add(num)
+                if len(numbers) == n:
+                    break
+
     if len(numbers) < n:
-        raise RuntimeError(f"Не удалось сгенерировать {n} чисел за {max_attempts} попыток")
-    
+        raise RuntimeError(f"Не удалось сгенерировать {n} чисел за {n * 100} попыток")
+
     return list(numbers)
 
-def generate_random_numbers_numpy(n: int, a: int, b: int, even_only: bool = True) -> List[int]:
+def generate_random_numbers_numpy(n: int, a: int, b: int, even_only: bool = True) -> np.ndarray:
     """
-    Генерирует список случайных чисел без повторов используя numpy без циклов.
-    
+    Генерирует массив случайных чисел без повторов используя numpy без циклов.
+
+    Выбираются индексы среди подходящих чисел и пересчитываются в значения,
+    поэтому массив всего диапазона не строится.
+
     Args:
         n: Количество чисел для генерации
         a: Нижняя граница интервала
@@ -91,60 +191,59 @@ def generate_random_numbers_numpy(n: int, a: int, b: int, even_only: bool = True
         even_only: True для четных чисел, False для нечетных
     
     Returns:
-        Список уникальных случайных чисел
+        Массив уникальных случайных чисел
     """
-    
-    if even_only:
-        # Генерируем четные числа
-        start = a if a % 2 == 0 else a + 1
-        all_numbers = np.arange(start, b + 1, 2)
-    else:
-        # Генерируем нечетные числа
-        start = a if a % 2 != 0 else a + 1
-        all_numbers = np.arange(start, b + 1, 2)
-    
+    start, count = _parity_range(a, b, even_only)
+
     # Проверяем, достаточно ли чисел
-    if len(all_numbers) < n:
+    if count < n:
         raise ValueError(f"Недостаточно {'четных' if even_only else 'нечетных'} чисел в диапазоне")
-    
-    # Выбираем n уникальных чисел
-    selected = np.random.choice(all_numbers, size=n, replace=False)
-    return selected.tolist()
 
-def measure_execution_time_precise(func, *args, runs: int = 10) -> Tuple[List[int], float]:
+    # Выбираем n уникальных индексов и переводим их в значения без построения диапазона
+    indices = _rng.choice(count, size=n, replace=False, shuffle=False)
+    return start + 2 * indices
+
+def measure_execution_time_precise(func, *args, runs: int = 10) -> Tuple[Any, float]:
     """
     Точно измеряет время выполнения функции с несколькими запусками.
-    
+
+    В качестве оценки берется минимальное время: шум измерений только
+    увеличивает время выполнения, поэтому минимум наиболее устойчив.
+
     Args:
         func: Функция для измерения
         *args: Аргументы функции
-        runs: Количество запусков для усреднения
-    
+        runs: Количество запусков
+
     Returns:
-        Кортеж (результат последнего запуска, среднее время выполнения в секундах)
+        Кортеж (результат последнего запуска, минимальное время выполнения в секундах)
     """
     times = []
-    result = []  
-    
-    for _ in range(runs):
-        start_time = time.perf_counter()
-        try:
-            result = func(*args)
-        except Exception:
-            
-            raise
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-    
-    
-    if len(times) >= 3:
-        times.sort()
-        times = times[1:-1]  
-    
-    avg_time = statistics.mean(times) if times else 0.0
-    return result, avg_time
+    result = []
+    # Аргументы связываем один раз, а таймер держим в локальной переменной
+    bound = functools.partial(func, *args)
+    perf_counter_ns = time.perf_counter_ns
+
+    # Сборщик мусора не должен срабатывать внутри замеров
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            # Освобождаем предыдущий результат до замера, чтобы его память переиспользовалась
+            result = None
+            start_time = perf_counter_ns()
+            result = bound()
+            end_time = perf_counter_ns()
+            times.append(end_time - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    min_time = min(times) / 1e9 if times else 0.0
+    return result, min_time
 
-def run_comparison_test(n: int, a: int, b: int, even_only: bool = True) -> Tuple[float, float, float, List[int], List[int], List[int]]:
+def run_comparison_test(n: int, a: int, b: int, even_only: bool = True) -> Tuple[float, float, float, List[int], List[int], np.ndarray]:
     """
     Запускает тест сравнения производительности всех трех методов.
     
@@ -160,15 +259,15 @@ def run_comparison_test(n: int, a: int, b: int, even_only: bool = True) -> Tuple
     print(f"\nТест для n={n}, диапазон ({a}, {b}), {'четные' if even_only else 'нечетные'} числа:")
     
     # Определяем количество прогонов в зависимости от n
-    runs = max(3, min(100, 1000 // max(1, n // 10)))
-    print(f"Количество прогонов для усреднения: {runs}")
+    runs = max(3, min(50, 500 // max(1, n // 10)))
+    print(f"Количество прогонов: {runs}")
     
     # Тест с list
     time_list = float('inf')
     result_list = []
     try:
         result_list, time_list = measure_execution_time_precise(generate_random_numbers_list, n, a, b, even_only, runs=runs)
-        print(f"List метод: {time_list:.6f} секунд (среднее)")
+        print(f"List метод: {time_list:.6f} секунд (минимум)")
         write_list_to_csv(result_list, f"random_numbers_list_{n}.csv")
     except Exception as e:
         print(f"List метод: Ошибка - {e}")
@@ -178,18 +277,18 @@ def run_comparison_test(n: int, a: int, b: int, even_only: bool = True) -> Tuple
     result_set = []
     try:
         result_set, time_set = measure_execution_time_precise(generate_random_numbers_set, n, a, b, even_only, runs=runs)
-        print(f"Set метод: {time_set:.6f} секунд (среднее)")
+        print(f"Set метод: {time_set:.6f} секунд (минимум)")
         write_list_to_csv(result_set, f"random_numbers_set_{n}.csv")
     except Exception as e:
         print(f"Set метод: Ошибка - {e}")
     
     # Тест с numpy
     time_numpy = float('inf')
-    result_numpy = []
+    result_numpy = np.array([], dtype=np.int64)
     try:
         result_numpy, time_numpy = measure_execution_time_precise(generate_random_numbers_numpy, n, a, b, even_only, runs=runs)
-        print(f"NumPy метод: {time_numpy:.6f} секунд (среднее)")
-        write_list_to_csv(result_numpy, f"random_numbers_numpy_{n}.csv")
+        print(f"NumPy метод: {time_numpy:.6f} секунд (минимум)")
+        write_array_to_csv(result_numpy, f"random_numbers_numpy_{n}.csv")
     except Exception as e:
         print(f"NumPy метод: Ошибка - {e}")
     
@@ -203,70 +302,71 @@ def write_performance_report(results: List[Tuple[int, Tuple[float, float, float]
         results: Список результатов тестов
         even_only: Флаг четных/нечетных чисел
     """
-    with open("performance_report.md", "w", encoding="utf-8") as f:
-        f.write(" Отчет о производительности генерации случайных чисел\n\n")
-        f.write(f"Тип чисел: {'четные' if even_only else 'нечетные'}\n\n")
-        
-        f.write(" Результаты тестирования\n\n")
-        f.write("| n | List (мкс) | Set (мкс) | NumPy (мкс) | Быстрейший |\n")
-        f.write("|---|------------|-----------|-------------|-------------|\n")
-        
+    parts = []
+    parts.append(" Отчет о производительности генерации случайных чисел\n\n")
+    parts.append(f"Тип чисел: {'четные' if even_only else 'нечетные'}\n\n")
+
+    parts.append(" Результаты тестирования\n\n")
+    parts.append("| n | List (мкс) | Set (мкс) | NumPy (мкс) | Быстрейший |\n")
+    parts.append("|---|------------|-----------|-------------|-------------|\n")
+
+    for n, (time_list, time_set, time_numpy) in results:
+        # Переводим в микросекунды для лучшей читаемости
+        list_micro = time_list * 1_000_000 if time_list != float('inf') else float('inf')
+        set_micro = time_set * 1_000_000 if time_set != float('inf') else float('inf')
+        numpy_micro = time_numpy * 1_000_000 if time_numpy != float('inf') else float('inf')
+
+        # Определяем быстрейший метод
+        times_dict = {'List': time_list, 'Set': time_set, 'NumPy': time_numpy}
+        valid_times = {k: v for k, v in times_dict.items() if v != float('inf')}
+        fastest = min(valid_times.keys(), key=lambda k: valid_times[k]) if valid_times else "N/A"
+
+        list_str = f"{list_micro:.1f}" if list_micro != float('inf') else "∞"
+        set_str = f"{set_micro:.1f}" if set_micro != float('inf') else "∞"
+        numpy_str = f"{numpy_micro:.1f}" if numpy_micro != float('inf') else "∞"
+
+        parts.append(f"| {n} | {list_str} | {set_str} | {numpy_str} | **{fastest}** |\n")
+
+    parts.append("\n Анализ результатов\n\n")
+
+    # Анализ производительности
+    if results:
+        parts.append(" Фактическая производительность:\n\n")
         for n, (time_list, time_set, time_numpy) in results:
-            # Переводим в микросекунды для лучшей читаемости
-            list_micro = time_list * 1_000_000 if time_list != float('inf') else float('inf')
-            set_micro = time_set * 1_000_000 if time_set != float('inf') else float('inf')
-            numpy_micro = time_numpy * 1_000_000 if time_numpy != float('inf') else float('inf')
-            
-            # Определяем быстрейший метод
-            times_dict = {'List': time_list, 'Set': time_set, 'NumPy': time_numpy}
-            valid_times = {k: v for k, v in times_dict.items() if v != float('inf')}
-            fastest = min(valid_times.keys(), key=lambda k: valid_times[k]) if valid_times else "N/A"
-            
-            list_str = f"{list_micro:.1f}" if list_micro != float('inf') else "∞"
-            set_str = f"{set_micro:.1f}" if set_micro != float('inf') else "∞"
-            numpy_str = f"{numpy_micro:.1f}" if numpy_micro != float('inf') else "∞"
-            
-            f.write(f"| {n} | {list_str} | {set_str} | {numpy_str} | **{fastest}** |\n")
-        
-        f.write("\n Анализ результатов\n\n")
-        
-        # Анализ производительности
-        if results:
-            f.write(" Фактическая производительность:\n\n")
-            for n, (time_list, time_set, time_numpy) in results:
-                times = {'List': time_list, 'Set': time_set, 'NumPy': time_numpy}
-                valid_times = {k: v for k, v in times.items() if v != float('inf')}
-                if valid_times:
-                    fastest = min(valid_times.keys(), key=lambda k: valid_times[k])
-                    slowest = max(valid_times.keys(), key=lambda k: valid_times[k])
-                    
-                    f.write(f"**n={n}**: Быстрейший - {fastest}, медленнейший - {slowest}\n")
-                    
-                    if len(valid_times) >= 2:
-                        fastest_time = valid_times[fastest]
-                        slowest_time = valid_times[slowest]
-                        if fastest_time > 0:
-                            ratio = slowest_time / fastest_time
-                            f.write(f"  - {slowest} медленнее {fastest} в {ratio:.1f} раз\n")
-                f.write("\n")
-        
-        f.write(" Теоретический анализ vs Реальность:\n\n")
-        f.write("1. Для малых n (< 1000):\n")
-        f.write("   - NumPy может быть медленнее из-за накладных расходов на инициализацию\n")
-        f.write("   - List и Set показывают похожую производительность\n")
-        f.write("   - Разница в производительности может быть незначительной\n\n")
-        
-        f.write("2. Для средних n (1000-10000):\n")
-        f.write("   - Начинает проявляться O(n²) сложность List метода\n")
-        f.write("   - Set метод становится заметно быстрее List\n")
-        f.write("   - NumPy может показать преимущество\n\n")
-        
-        f.write("3. Для больших n (> 10000):\n")
-        f.write("   - List метод становится неприемлемо медленным\n")
-        f.write("   - Set и NumPy методы значительно опережают List\n")
-        f.write("   - NumPy обычно показывает лучшую производительность\n\n")
-        
-        
+            times = {'List': time_list, 'Set': time_set, 'NumPy': time_numpy}
+            valid_times = {k: v for k, v in times.items() if v != float('inf')}
+            if valid_times:
+                fastest = min(valid_times.keys(), key=lambda k: valid_times[k])
+                slowest = max(valid_times.keys(), key=lambda k: valid_times[k])
+
+                parts.append(f"**n={n}**: Быстрейший - {fastest}, медленнейший - {slowest}\n")
+
+                if len(valid_times) >= 2:
+                    fastest_time = valid_times[fastest]
+                    slowest_time = valid_times[slowest]
+                    if fastest_time > 0:
+                        ratio = slowest_time / fastest_time
+                        parts.append(f"  - {slowest} медленнее {fastest} в {ratio:.1f} раз\n")
+            parts.append("\n")
+
+    parts.append(" Теоретический анализ vs Реальность:\n\n")
+    parts.append("1. Для малых n (< 1000):\n")
+    parts.append("   - NumPy может быть медленнее из-за накладных расходов на инициализацию\n")
+    parts.append("   - List и Set показывают похожую производительность\n")
+    parts.append("   - Разница в производительности может быть незначительной\n\n")
+
+    parts.append("2. Для средних n (1000-10000):\n")
+    parts.append("   - Начинает проявляться O(n²) сложность List метода\n")
+    parts.append("   - Set метод становится заметно быстрее List\n")
+    parts.append("   - NumPy может показать преимущество\n\n")
+
+    parts.append("3. Для больших n (> 10000):\n")
+    parts.append("   - List метод становится неприемлемо медленным\n")
+    parts.append("   - Set и NumPy методы значительно опережают List\n")
+    parts.append("   - NumPy обычно показывает лучшую производительность\n\n")
+
+    with open("performance_report.md", "w", buffering=1 << 16, encoding="utf-8") as f:
+        f.write("".join(parts))
 
 def process_and_save_results(arr: np.ndarray, n: int) -> None:
     """
@@ -293,21 +393,24 @@ def process_and_save_results(arr: np.ndarray, n: int) -> None:
             results[transformation] = (float('nan'), float('nan'))
     
     # Сохраняем результаты в файл
-    with open(f"processing_results_{n}.md", "w", encoding="utf-8") as f:
-        f.write("# Результаты обработки массива\n\n")
-        f.write(f"Размер массива: {n} элементов\n")
-        f.write(f"Диапазон значений: [{np.min(arr)}, {np.max(arr)}]\n")
-        f.write(f"Среднее значение: {np.mean(arr):.2f}\n")
-        f.write(f"Стандартное отклонение: {np.std(arr):.2f}\n\n")
-        
-        f.write("Результаты преобразований\n\n")
-        f.write("| Преобразование | Сумма | Произведение |\n")
-        f.write("|----------------|-------|--------------|\n")
-        
-        for transformation, (sum_val, product_val) in results.items():
-            sum_str = f"{sum_val:.6e}" if abs(sum_val) > 1e6 or abs(sum_val) < 1e-6 else f"{sum_val:.6f}"
-            product_str = f"{product_val:.6e}" if abs(product_val) > 1e6 or abs(product_val) < 1e-6 else f"{product_val:.6f}"
-            f.write(f"| {transformation} | {sum_str} | {product_str} |\n")
+    parts = []
+    parts.append("# Результаты обработки массива\n\n")
+    parts.append(f"Размер массива: {n} элементов\n")
+    parts.append(f"Диапазон значений: [{np.min(arr)}, {np.max(arr)}]\n")
+    parts.append(f"Среднее значение: {np.mean(arr):.2f}\n")
+    parts.append(f"Стандартное отклонение: {np.std(arr):.2f}\n\n")
+
+    parts.append("Результаты преобразований\n\n")
+    parts.append("| Преобразование | Сумма | Произведение |\n")
+    parts.append("|----------------|-------|--------------|\n")
+
+    for transformation, (sum_val, product_val) in results.items():
+        sum_str = f"{sum_val:.6e}" if abs(sum_val) > 1e6 or abs(sum_val) < 1e-6 else f"{sum_val:.6f}"
+        product_str = f"{product_val:.6e}" if abs(product_val) > 1e6 or abs(product_val) < 1e-6 else f"{product_val:.6f}"
+        parts.append(f"| {transformation} | {sum_str} | {product_str} |\n")
+
+    with open(f"processing_results_{n}.md", "w", buffering=1 << 16, encoding="utf-8") as f:
+        f.write("".join(parts))
 
 def main() -> None:
     """
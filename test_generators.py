@@ -2,33 +2,64 @@ import pytest
 import numpy as np
 from main import generate_random_numbers_list, generate_random_numbers_set, generate_random_numbers_numpy
 
+def _assert_unique(xs):
+    """Проверяет отсутствие повторов: в отсортированной последовательности соседи различны"""
+    s = sorted(xs)
+    assert all(a != b for a, b in zip(s, s[1:]))
+
+def _assert_parity(xs, parity):
+    """Проверяет четность всех элементов одной векторной операцией"""
+    assert (np.asarray(xs) % 2 == parity).all()
+
 def test_list_generation():
     """Тест генерации с использованием list"""
     result = generate_random_numbers_list(100, 1, 1000, True)
     assert len(result) == 100
-    assert all(x % 2 == 0 for x in result)
-    assert len(set(result)) == 100  # Все элементы уникальны
+    _assert_parity(result, 0)
+    _assert_unique(result)  # Все элементы уникальны
 
 def test_set_generation():
     """Тест генерации с использованием set"""
     result = generate_random_numbers_set(100, 1, 1000, False)
     assert len(result) == 100
-    assert all(x % 2 == 1 for x in result)
-    assert len(set(result)) == 100
+    _assert_parity(result, 1)
+    _assert_unique(result)
 
 def test_numpy_generation():
     """Тест генерации с использованием numpy"""
     result = generate_random_numbers_numpy(100, 1, 1000, True)
     assert len(result) == 100
-    assert all(x % 2 == 0 for x in result)
-    assert len(set(result)) == 100
+    _assert_parity(result, 0)
+    _assert_unique(result)
 
 def test_edge_cases():
     """Тест граничных случаев"""
     # Проверка малого количества чисел
     result = generate_random_numbers_numpy(1, 2, 2, True)
-    assert result == [2]
+    assert result.tolist() == [2]
     
     # Проверка ошибки при недостатке чисел
     with pytest.raises(ValueError):
-        generate_random_numbers_numpy(100, 1, 10, True)
\ No newline at end of file
+        generate_random_numbers_numpy(100, 1, 10, True)
+
+def test_list_set_insufficient_numbers():
+    """Тест ошибки при недостатке чисел для list и set"""
+    for generate in (generate_random_numbers_list, generate_random_numbers_set):
+        with pytest.raises(RuntimeError):
+            generate(6, 1, 10, True)
+        with pytest.raises(RuntimeError):
+            generate(1, 3, 3, True)
+
+def test_list_set_all_available_numbers():
+    """Тест выбора всех доступных чисел диапазона"""
+    for generate in (generate_random_numbers_list, generate_random_numbers_set):
+        result = generate(5, 1, 10, True)
+        assert sorted(result) == [2, 4, 6, 8, 10]
+
+def test_list_set_bounds_outside_int64():
+    """Тест границ, не помещающихся в int64"""
+    for generate in (generate_random_numbers_list, generate_random_numbers_set):
+        result = generate(5, 1, 10**19, True)
+        assert len(result) == 5
+        assert all(x % 2 == 0 and 1 <= x <= 10**19 for x in result)
+        _assert_unique(result)
\ No newline at end of file
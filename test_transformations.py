@@ -0,0 +1,14 @@
+import numpy as np
+from transformations import sigmoid, softplus
+
+def test_sigmoid_extreme_values():
+    """Сигмоида остается конечной и ограниченной при больших |x|"""
+    result = sigmoid(np.array([-1000.0, 0.0, 1000.0]))
+    assert np.all(np.isfinite(result))
+    np.testing.assert_allclose(result, [0.0, 0.5, 1.0])
+
+def test_softplus_extreme_values():
+    """Softplus не переполняется при больших x"""
+    result = softplus(np.array([-1000.0, 0.0, 1000.0]))
+    assert np.all(np.isfinite(result))
+    np.testing.assert_allclose(result, [0.0, np.log(2.0), 1000.0])
@@ -1,9 +1,14 @@
 import numpy as np
+from types import MappingProxyType
 from typing import Tuple
 
 def sigmoid(x: np.ndarray) -> np.ndarray:
     """Вычисляет сигмоиду для каждого элемента массива."""
-    return 1 / (1 + np.exp(-x))
+    # 1 / (1 + e^-x) = (1 + tanh(x / 2)) / 2; tanh не переполняется при больших |x|
+    result = np.tanh(0.5 * x)
+    result *= 0.5
+    result += 0.5
+    return result
 
 def relu(x: np.ndarray) -> np.ndarray:
     """Вычисляет ReLU для каждого элемента массива."""
@@ -16,26 +21,55 @@ def tanh(x: np.ndarray) -> np.ndarray:
 def softmax(x: np.ndarray) -> np.ndarray:
     """Вычисляет softmax для массива."""
     exp_x = np.exp(x - np.max(x))  # Для численной стабильности
-    return exp_x / exp_x.sum()
+    exp_x /= exp_x.sum()  # Нормируем на месте, без второго временного массива
+    return exp_x
+
+def _result_dtype(x: np.ndarray) -> np.dtype:
+    """Тип результата: вещественный тип входа сохраняется, целые приводятся к float64."""
+    if np.issubdtype(x.dtype, np.inexact):
+        return x.dtype
+    return np.result_type(x, np.float64)
 
 def normalize(x: np.ndarray) -> np.ndarray:
     """Нормализует значения массива к диапазону [0, 1]."""
     x_min = np.min(x)
     x_max = np.max(x)
-    return (x - x_min) / (x_max - x_min)
+    result = np.subtract(x, x_min, dtype=_result_dtype(x))
+    result /= x_max - x_min
+    return result
 
 def standardize(x: np.ndarray) -> np.ndarray:
     """Стандартизирует массив (z-score)."""
-    return (x - np.mean(x)) / np.std(x)
+    # Отклонения считаем один раз: np.std заново вычислил бы среднее и разности
+    deviations = np.subtract(x, np.mean(x), dtype=_result_dtype(x))
+    std = np.sqrt(np.vdot(deviations, deviations) / deviations.size)
+    deviations /= std
+    return deviations
 
 def softplus(x: np.ndarray) -> np.ndarray:
     """Вычисляет softplus для каждого элемента массива."""
-    return np.log(1 + np.exp(x))
+    # log(1 + e^x) = max(x, 0) + log(1 + e^-|x|): exp не переполняется при больших |x|
+    result = np.exp(-np.abs(x))
+    np.log1p(result, out=result)
+    result += np.maximum(x, 0)
+    return result
 
 def gaussian(x: np.ndarray) -> np.ndarray:
     """Вычисляет гауссову функцию для каждого элемента массива."""
     return np.exp(-x**2)
 
+# Доступные преобразования по имени; словарь строится один раз при импорте
+_TRANSFORMATIONS = MappingProxyType({
+    'sigmoid': sigmoid,
+    'relu': relu,
+    'tanh': tanh,
+    'softmax': softmax,
+    'normalize': normalize,
+    'standardize': standardize,
+    'softplus': softplus,
+    'gaussian': gaussian
+})
+
 def safe_product_calculation(arr: np.ndarray) -> Tuple[float, float]:
     """
     Безопасно вычисляет сумму и произведение с обработкой больших чисел.
@@ -43,22 +77,21 @@ def safe_product_calculation(arr: np.ndarray) -> Tuple[float, float]:
     Returns:
         Кортеж (сумма, произведение) или (сумма, логарифм произведения)
     """
-    try:
-        # Вычисляем сумму
-        sum_val = float(np.sum(arr))
-        
-        # Пытаемся вычислить произведение
-        product = np.prod(arr)
-        if np.isfinite(product) and abs(product) > 1e-300:  # Проверяем на переполнение и слишком малые значения
-            return sum_val, float(product)
-        else:
-            # Используем логарифмы для избежания переполнения
-            log_product = np.sum(np.log(np.abs(arr) + 1e-12))
-            return sum_val, float(log_product)
-    except:
-        # В случае ошибки используем логарифмический подход
-        log_product = np.sum(np.log(np.abs(arr) + 1e-12))
-        return sum_val, float(log_product)
+    # Целочисленный массив (например, после relu) при np.prod молча переполняется
+    arr = np.asarray(arr, dtype=np.float64)
+    sum_val = float(arr.sum())
+
+    # Логарифм модуля произведения вычисляем заранее: он же нужен как запасной результат
+    log_product = float(np.log(np.abs(arr) + 1e-12).sum())
+
+    # log|prod| <= log_product, поэтому при log_product < 709 произведение конечно
+    if log_product < 709.0:
+        product = float(np.prod(arr))
+        if abs(product) > 1e-300:  # Проверяем на слишком малые значения
+            return sum_val, product
+
+    # Используем логарифмы для избежания переполнения
+    return sum_val, log_product
 
 def process_array(arr: np.ndarray, transformation: str) -> Tuple[float, float]:
     """
@@ -71,19 +104,9 @@ def process_array(arr: np.ndarray, transformation: str) -> Tuple[float, float]:
     Returns:
         Кортеж (сумма, произведение)
     """
-    transformations = {
-        'sigmoid': sigmoid,
-        'relu': relu,
-        'tanh': tanh,
-        'softmax': softmax,
-        'normalize': normalize,
-        'standardize': standardize,
-        'softplus': softplus,
-        'gaussian': gaussian
-    }
-    
-    if transformation not in transformations:
+    transform = _TRANSFORMATIONS.get(transformation)
+    if transform is None:
         raise ValueError(f"Неизвестное преобразование: {transformation}")
     
-    transformed = transformations[transformation](arr)
+    transformed = transform(arr)
     return safe_product_calculation(transformed)
\ No newline at end of file